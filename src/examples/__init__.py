@@ -0,0 +1,3 @@
+# Runnable reference examples for the future FastAPI backend and React
+# dashboard. Kept as real files (not string constants) so they are
+# syntax-highlightable and not parsed on every import of src.executor.
@@ -0,0 +1,61 @@
+from fastapi import FastAPI, HTTPException
+from typing import List, Dict
+import json
+import os
+
+app = FastAPI(title="AI Test Automation Dashboard")
+
+def _report_entries(reports_dir: str = "reports"):
+    """List (mtime, path) pairs for report files in one scandir pass.
+
+    os.scandir returns name and stat info together, so this avoids both
+    glob's pattern matching and a separate stat call per file.
+    """
+    if not os.path.isdir(reports_dir):
+        return []
+    with os.scandir(reports_dir) as it:
+        return [
+            (entry.stat().st_mtime, entry.path)
+            for entry in it
+            if entry.is_file()
+            and entry.name.startswith("test_report_")
+            and entry.name.endswith(".json")
+        ]
+
+@app.get("/api/test-results/latest")
+async def get_latest_test_results():
+    """Get the latest test execution results."""
+    entries = _report_entries()
+
+    if not entries:
+        raise HTTPException(status_code=404, detail="No test reports found")
+
+    latest_file = max(entries)[1]
+
+    with open(latest_file) as f:
+        return json.load(f)
+
+@app.get("/api/test-results/history")
+async def get_test_history(limit: int = 10):
+    """Get test execution history."""
+    entries = sorted(_report_entries(), reverse=True)
+
+    results = []
+    for _mtime, file_path in entries[:limit]:
+        with open(file_path) as f:
+            data = json.load(f)
+            results.append({
+                "timestamp": data.get("created"),
+                "success": data.get("summary", {}).get("failed", 0) == 0,
+                "total": data.get("summary", {}).get("total", 0),
+                "passed": data.get("summary", {}).get("passed", 0),
+                "failed": data.get("summary", {}).get("failed", 0)
+            })
+
+    return results
+
+@app.get("/api/test-results/trends")
+async def get_test_trends():
+    """Get test execution trends and statistics."""
+    # Implementation for calculating trends
+    return {"message": "Trends endpoint - to be implemented"}
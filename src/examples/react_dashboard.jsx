@@ -0,0 +1,78 @@
+// TestDashboard.jsx
+import React, { useState, useEffect } from 'react';
+import axios from 'axios';
+
+const TestDashboard = () => {
+  const [latestResults, setLatestResults] = useState(null);
+  const [testHistory, setTestHistory] = useState([]);
+  const [loading, setLoading] = useState(true);
+
+  useEffect(() => {
+    fetchLatestResults();
+    fetchTestHistory();
+  }, []);
+
+  const fetchLatestResults = async () => {
+    try {
+      const response = await axios.get('/api/test-results/latest');
+      setLatestResults(response.data);
+    } catch (error) {
+      console.error('Error fetching latest results:', error);
+    }
+  };
+
+  const fetchTestHistory = async () => {
+    try {
+      const response = await axios.get('/api/test-results/history');
+      setTestHistory(response.data);
+      setLoading(false);
+    } catch (error) {
+      console.error('Error fetching test history:', error);
+      setLoading(false);
+    }
+  };
+
+  if (loading) {
+    return <div className="loading">Loading test results...</div>;
+  }
+
+  return (
+    <div className="dashboard">
+      <h1>🚀 AI Test Automation Dashboard</h1>
+
+      {/* Latest Results Card */}
+      {latestResults && (
+        <div className="results-card">
+          <h2>Latest Test Results</h2>
+          <div className="summary">
+            <div className={`status ${latestResults.summary?.failed === 0 ? 'success' : 'failure'}`}>
+              {latestResults.summary?.failed === 0 ? '✅ All Passed' : '❌ Some Failed'}
+            </div>
+            <div className="stats">
+              <span>Total: {latestResults.summary?.total}</span>
+              <span>Passed: {latestResults.summary?.passed}</span>
+              <span>Failed: {latestResults.summary?.failed}</span>
+            </div>
+          </div>
+        </div>
+      )}
+
+      {/* Test History Chart */}
+      <div className="history-section">
+        <h2>Test History</h2>
+        <div className="history-list">
+          {testHistory.map((result, index) => (
+            <div key={index} className="history-item">
+              <div className="timestamp">{new Date(result.timestamp).toLocaleString()}</div>
+              <div className={`result ${result.success ? 'success' : 'failure'}`}>
+                {result.success ? '✅' : '❌'} {result.passed}/{result.total}
+              </div>
+            </div>
+          ))}
+        </div>
+      </div>
+    </div>
+  );
+};
+
+export default TestDashboard;
@@ -1,12 +1,60 @@
-import pytest
 import os
+import sys
 import json
+import importlib.util
+import multiprocessing
+import signal
 import subprocess
 from typing import Dict, List, Optional
+
+# Optional: streaming JSON parser for large report files
+# Installation: pip install ijson
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Optional: orjson decodes report files a few times faster than stdlib
+# json. Installation: pip install orjson
+try:
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+except ImportError:
+    def _loads(data):
+        return json.loads(data)
 from datetime import datetime
-import tempfile
 from pathlib import Path
 
+# Arguments that trim pytest startup overhead for one-shot report runs:
+# the cache plugin buys nothing here (each run is fresh, results are never
+# reused) and importlib import mode skips the legacy rootdir-walking
+# import behavior during collection
+_PYTEST_FAST_STARTUP_ARGS = ["-p", "no:cacheprovider", "--import-mode=importlib"]
+
+# Exit-code -> status message, built once at import time
+_STATUS_MESSAGES = {
+    0: "🎉 All tests passed!",
+    1: "❌ Some tests failed",
+    5: "⚠️ No tests collected"
+}
+
+# Base suggestion lists, shared across calls
+_SUCCESS_SUGGESTIONS = [
+    "🎉 Great job! All tests are passing",
+    "💡 Consider adding more edge cases",
+    "🔍 Review code coverage reports",
+    "📈 Monitor test performance trends"
+]
+
+_FAILURE_SUGGESTIONS = [
+    "🔧 Review failed tests and fix issues",
+    "📝 Check test data and assertions",
+    "🐛 Look for common patterns in failures",
+    "🚀 Consider test parallelization for faster feedback"
+]
+
 
 class TestReporter:
     """
@@ -15,53 +63,113 @@ class TestReporter:
     """
 
     def __init__(self, test_dir: str = "tests/generated", reports_dir: str = "reports"):
-        self.test_dir = test_dir
-        self.reports_dir = reports_dir
+        # Cached Path objects: report paths are then built with Path
+        # arithmetic instead of repeated os.path.join string parsing
+        self.test_dir = Path(test_dir)
+        self.reports_dir = Path(reports_dir)
         self.ensure_directories()
 
     def ensure_directories(self):
         """Create necessary directories."""
-        os.makedirs(self.test_dir, exist_ok=True)
-        os.makedirs(self.reports_dir, exist_ok=True)
+        self.test_dir.mkdir(parents=True, exist_ok=True)
+        self.reports_dir.mkdir(parents=True, exist_ok=True)
+
+    def _build_xdist_args(self, workers) -> List[str]:
+        """
+        Build pytest-xdist arguments for parallel test execution.
+
+        Installation required: pip install pytest-xdist
+
+        Tests are sharded across CPU cores with --dist=loadfile so tests in
+        the same file stay on the same worker. Falls back to serial execution
+        (empty argument list) when pytest-xdist is not installed.
+        """
+        if importlib.util.find_spec("xdist") is None:
+            return []
+
+        # "auto" lets xdist pick the worker count; otherwise leave two cores
+        # of headroom so the machine stays responsive during test runs
+        n = workers if workers else max(1, multiprocessing.cpu_count() - 2)
+        return ["-n", str(n), "--dist=loadfile"]
+
+    def _run_pytest(self, cmd: List[str], capture_output: bool = False, timeout: int = 300):
+        """
+        Execute a pytest command without buffering stdout unless asked.
+
+        Verbose pytest output can run to megabytes of PASSED lines; when the
+        report file already carries the data, stdout goes to DEVNULL and only
+        stderr (small, useful for error diagnosis) is kept.
 
-    def run_tests_with_html_report(self, test_files: List[str] = None) -> Dict:
+        The child runs in its own process group (session on POSIX, new
+        process group on Windows) so that on timeout the whole group -
+        including any pytest-xdist workers - is terminated instead of being
+        orphaned when only the direct child dies.
+        """
+        stdout = subprocess.PIPE if capture_output else subprocess.DEVNULL
+        popen_kwargs = {}
+        if os.name == 'posix':
+            popen_kwargs['preexec_fn'] = os.setsid
+        elif os.name == 'nt':
+            popen_kwargs['creationflags'] = subprocess.CREATE_NEW_PROCESS_GROUP
+
+        proc = subprocess.Popen(cmd, stdout=stdout, stderr=subprocess.PIPE,
+                                text=True, **popen_kwargs)
+        try:
+            out, err = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            # Kill the whole group so xdist workers don't outlive the run
+            if os.name == 'posix':
+                try:
+                    os.killpg(os.getpgid(proc.pid), signal.SIGTERM)
+                except ProcessLookupError:
+                    pass
+            else:
+                proc.terminate()
+            try:
+                proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+            raise
+
+        return subprocess.CompletedProcess(cmd, proc.returncode, out, err)
+
+    def run_tests_with_html_report(self, test_files: List[str] = None, workers: str = "auto",
+                                   capture_output: bool = False, timeout: int = 300) -> Dict:
         """
         Run pytest with HTML report generation using pytest-html.
 
         Installation required: pip install pytest-html
+        Optional (parallel execution): pip install pytest-xdist
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        html_report_path = os.path.join(self.reports_dir, f"test_report_{timestamp}.html")
-
-        # Prepare command
-        if test_files is None:
-            cmd = [
-                "python", "-m", "pytest",
-                self.test_dir,
-                f"--html={html_report_path}",
-                "--self-contained-html",  # Single file report
-                "-v",
-                "--tb=short"
-            ]
-        else:
-            cmd = [
-                      "python", "-m", "pytest"
-                  ] + test_files + [
-                      f"--html={html_report_path}",
-                      "--self-contained-html",
-                      "-v",
-                      "--tb=short"
-                  ]
+        # One clock read per call; both formatted stamps derive from it
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        html_report_path = self.reports_dir / f"test_report_{timestamp}.html"
+        xdist_args = self._build_xdist_args(workers)
+
+        # Prepare command (sys.executable skips the PATH search and pins
+        # the interpreter currently running)
+        cmd = [sys.executable, "-m", "pytest"]
+        cmd.extend(xdist_args)
+        cmd.extend(test_files if test_files is not None else [str(self.test_dir)])
+        cmd.extend([
+            f"--html={html_report_path}",
+            "--self-contained-html",  # Single file report
+            "-v",
+            "--tb=short"
+        ])
+        cmd.extend(_PYTEST_FAST_STARTUP_ARGS)
 
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+            result = self._run_pytest(cmd, capture_output, timeout)
 
             return {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now.isoformat(),
                 "exit_code": result.returncode,
                 "success": result.returncode == 0,
-                "html_report_path": html_report_path if os.path.exists(html_report_path) else None,
-                "stdout": result.stdout,
+                "html_report_path": str(html_report_path) if html_report_path.exists() else None,
+                "stdout": result.stdout or "",
                 "stderr": result.stderr,
                 "report_type": "HTML",
                 "message": self._get_status_message(result.returncode)
@@ -71,51 +179,51 @@ class TestReporter:
         except Exception as e:
             return {"error": str(e), "success": False}
 
-    def run_tests_with_allure_report(self, test_files: List[str] = None) -> Dict:
+    def run_tests_with_allure_report(self, test_files: List[str] = None, workers: str = "auto",
+                                     capture_output: bool = False, timeout: int = 300) -> Dict:
         """
         Run pytest with Allure report generation.
 
         Installation required:
         - pip install allure-pytest
         - Install Allure commandline tool
+        Optional (parallel execution): pip install pytest-xdist
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        allure_results_dir = os.path.join(self.reports_dir, f"allure-results-{timestamp}")
-        allure_report_dir = os.path.join(self.reports_dir, f"allure-report-{timestamp}")
+        # One clock read per call; both formatted stamps derive from it
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        allure_results_dir = self.reports_dir / f"allure-results-{timestamp}"
+        allure_report_dir = self.reports_dir / f"allure-report-{timestamp}"
+        # xdist workers all write into the same --alluredir, so sharding is
+        # safe for the allure results format
+        xdist_args = self._build_xdist_args(workers)
 
         # Prepare pytest command with allure
-        if test_files is None:
-            cmd = [
-                "python", "-m", "pytest",
-                self.test_dir,
-                f"--alluredir={allure_results_dir}",
-                "--clean-alluredir",
-                "-v"
-            ]
-        else:
-            cmd = [
-                      "python", "-m", "pytest"
-                  ] + test_files + [
-                      f"--alluredir={allure_results_dir}",
-                      "--clean-alluredir",
-                      "-v"
-                  ]
+        cmd = [sys.executable, "-m", "pytest"]
+        cmd.extend(xdist_args)
+        cmd.extend(test_files if test_files is not None else [str(self.test_dir)])
+        cmd.extend([
+            f"--alluredir={allure_results_dir}",
+            "--clean-alluredir",
+            "-v"
+        ])
+        cmd.extend(_PYTEST_FAST_STARTUP_ARGS)
 
         try:
             # Run tests with allure results
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+            result = self._run_pytest(cmd, capture_output, timeout)
 
             # Generate allure report
-            allure_cmd = ["allure", "generate", allure_results_dir, "-o", allure_report_dir, "--clean"]
+            allure_cmd = ["allure", "generate", str(allure_results_dir), "-o", str(allure_report_dir), "--clean"]
             allure_result = subprocess.run(allure_cmd, capture_output=True, text=True)
 
             return {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now.isoformat(),
                 "exit_code": result.returncode,
                 "success": result.returncode == 0,
-                "allure_results_dir": allure_results_dir,
-                "allure_report_dir": allure_report_dir if allure_result.returncode == 0 else None,
-                "stdout": result.stdout,
+                "allure_results_dir": str(allure_results_dir),
+                "allure_report_dir": str(allure_report_dir) if allure_result.returncode == 0 else None,
+                "stdout": result.stdout or "",
                 "stderr": result.stderr,
                 "allure_generation_success": allure_result.returncode == 0,
                 "report_type": "Allure",
@@ -126,49 +234,67 @@ class TestReporter:
         except Exception as e:
             return {"error": str(e), "success": False}
 
-    def run_tests_with_json_report(self, test_files: List[str] = None) -> Dict:
+    def _load_json_report(self, json_report_path: str, full_json: bool = False) -> Dict:
+        """
+        Load a pytest JSON report.
+
+        By default only the 'summary' section is extracted, keeping memory
+        proportional to the summary rather than the whole report. With ijson
+        installed (pip install ijson) the summary is streamed out of the file
+        without materializing the full report tree; otherwise the file is
+        parsed once and everything but the summary is dropped. Pass
+        full_json=True to get the complete report.
+        """
+        if full_json or ijson is None:
+            with open(json_report_path, 'rb') as f:
+                data = _loads(f.read())
+            return data if full_json else {"summary": data.get("summary", {})}
+
+        with open(json_report_path, 'rb') as f:
+            summary = next(ijson.items(f, 'summary'), {})
+        return {"summary": summary}
+
+    def run_tests_with_json_report(self, test_files: List[str] = None, workers: str = "auto",
+                                   capture_output: bool = False, full_json: bool = False,
+                                   timeout: int = 300) -> Dict:
         """
         Run pytest with JSON report generation using pytest-json-report.
 
         Installation required: pip install pytest-json-report
+        Optional (parallel execution): pip install pytest-xdist
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        json_report_path = os.path.join(self.reports_dir, f"test_report_{timestamp}.json")
+        # One clock read per call; both formatted stamps derive from it
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        json_report_path = self.reports_dir / f"test_report_{timestamp}.json"
+        xdist_args = self._build_xdist_args(workers)
 
         # Prepare command
-        if test_files is None:
-            cmd = [
-                "python", "-m", "pytest",
-                self.test_dir,
-                f"--json-report={json_report_path}",
-                "--json-report-summary",
-                "-v"
-            ]
-        else:
-            cmd = [
-                      "python", "-m", "pytest"
-                  ] + test_files + [
-                      f"--json-report={json_report_path}",
-                      "--json-report-summary",
-                      "-v"
-                  ]
+        cmd = [sys.executable, "-m", "pytest"]
+        cmd.extend(xdist_args)
+        cmd.extend(test_files if test_files is not None else [str(self.test_dir)])
+        cmd.extend([
+            f"--json-report={json_report_path}",
+            "--json-report-summary",
+            "-v"
+        ])
+        cmd.extend(_PYTEST_FAST_STARTUP_ARGS)
 
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+            result = self._run_pytest(cmd, capture_output, timeout)
 
             # Load JSON report if it exists
             json_data = None
-            if os.path.exists(json_report_path):
-                with open(json_report_path, 'r') as f:
-                    json_data = json.load(f)
+            if json_report_path.exists():
+                json_data = self._load_json_report(json_report_path, full_json)
 
             return {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now.isoformat(),
                 "exit_code": result.returncode,
                 "success": result.returncode == 0,
-                "json_report_path": json_report_path if os.path.exists(json_report_path) else None,
+                "json_report_path": str(json_report_path) if json_report_path.exists() else None,
                 "json_data": json_data,
-                "stdout": result.stdout,
+                "stdout": result.stdout or "",
                 "stderr": result.stderr,
                 "report_type": "JSON",
                 "message": self._get_status_message(result.returncode)
@@ -176,6 +302,128 @@ class TestReporter:
         except Exception as e:
             return {"error": str(e), "success": False}
 
+    def run_tests_all_formats(self, test_files: List[str] = None, workers: str = "auto",
+                              capture_output: bool = False, full_json: bool = False,
+                              timeout: int = 300) -> Dict:
+        """
+        Run pytest once and emit HTML, JSON, and Allure artifacts together.
+
+        Running the three run_tests_with_*_report methods back to back
+        collects and executes the suite three times; passing all three
+        reporter flags to a single invocation cuts wall-clock to one
+        suite run.
+
+        Installation required:
+        - pip install pytest-html pytest-json-report allure-pytest
+        - Install Allure commandline tool
+        """
+        # One clock read per call; both formatted stamps derive from it
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        html_report_path = self.reports_dir / f"test_report_{timestamp}.html"
+        json_report_path = self.reports_dir / f"test_report_{timestamp}.json"
+        allure_results_dir = self.reports_dir / f"allure-results-{timestamp}"
+        allure_report_dir = self.reports_dir / f"allure-report-{timestamp}"
+
+        # Prepare one command carrying all three reporter flags
+        cmd = [sys.executable, "-m", "pytest"]
+        cmd.extend(self._build_xdist_args(workers))
+        cmd.extend(test_files if test_files is not None else [str(self.test_dir)])
+        cmd.extend([
+            f"--html={html_report_path}",
+            "--self-contained-html",
+            f"--json-report={json_report_path}",
+            "--json-report-summary",
+            f"--alluredir={allure_results_dir}",
+            "--clean-alluredir",
+            "-v",
+            "--tb=short"
+        ])
+        cmd.extend(_PYTEST_FAST_STARTUP_ARGS)
+
+        try:
+            result = self._run_pytest(cmd, capture_output, timeout)
+
+            # Generate allure report from the collected results
+            allure_cmd = ["allure", "generate", str(allure_results_dir), "-o", str(allure_report_dir), "--clean"]
+            allure_result = subprocess.run(allure_cmd, capture_output=True, text=True)
+
+            # Load the JSON report once for all consumers
+            json_data = None
+            if json_report_path.exists():
+                json_data = self._load_json_report(json_report_path, full_json)
+
+            return {
+                "timestamp": now.isoformat(),
+                "exit_code": result.returncode,
+                "success": result.returncode == 0,
+                "html_report_path": str(html_report_path) if html_report_path.exists() else None,
+                "json_report_path": str(json_report_path) if json_report_path.exists() else None,
+                "json_data": json_data,
+                "allure_results_dir": str(allure_results_dir),
+                "allure_report_dir": str(allure_report_dir) if allure_result.returncode == 0 else None,
+                "allure_generation_success": allure_result.returncode == 0,
+                "stdout": result.stdout or "",
+                "stderr": result.stderr,
+                "report_type": "All formats",
+                "message": self._get_status_message(result.returncode)
+            }
+        except subprocess.TimeoutExpired:
+            return {"error": "Test execution timed out", "success": False}
+        except Exception as e:
+            return {"error": str(e), "success": False}
+
+    def run_tests_in_process(self, test_files: List[str] = None, timeout: int = 300) -> Dict:
+        """
+        Run pytest in the current interpreter via pytest.main().
+
+        Skips the fork/exec and interpreter startup cost (~0.5-1s per call)
+        of shelling out to "python -m pytest", which dominates on small test
+        runs. The cache plugin is disabled (-p no:cacheprovider) since cached
+        results are not reused across in-process runs.
+        """
+        # Imported lazily: pytest alone pulls in its whole plugin machinery
+        # at import time, which import-only consumers of this module (e.g.
+        # the FastAPI backend using TestResultsAPI) should not pay for
+        import contextlib
+        import io
+        import threading
+        import pytest
+
+        if test_files is None:
+            args = [str(self.test_dir)]
+        else:
+            args = list(test_files)
+        args += ["-v", "--tb=short", "-p", "no:cacheprovider"]
+
+        out_buf = io.StringIO()
+        err_buf = io.StringIO()
+        exit_codes = {}
+
+        def _invoke():
+            with contextlib.redirect_stdout(out_buf), contextlib.redirect_stderr(err_buf):
+                exit_codes["value"] = pytest.main(args)
+
+        # Run in a worker thread so the timeout semantics of the
+        # subprocess-based methods are preserved
+        runner = threading.Thread(target=_invoke, daemon=True)
+        runner.start()
+        runner.join(timeout=timeout)
+
+        if runner.is_alive():
+            return {"error": "Test execution timed out", "success": False}
+
+        exit_code = int(exit_codes.get("value", -1))
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "exit_code": exit_code,
+            "success": exit_code == 0,
+            "stdout": out_buf.getvalue(),
+            "stderr": err_buf.getvalue(),
+            "report_type": "In-process",
+            "message": self._get_status_message(exit_code)
+        }
+
     def generate_console_report(self, results: Dict) -> str:
         """Generate formatted console report."""
         report_lines = [
@@ -229,33 +477,14 @@ class TestReporter:
 
     def _get_status_message(self, exit_code: int) -> str:
         """Generate status message based on exit code."""
-        if exit_code == 0:
-            return "🎉 All tests passed!"
-        elif exit_code == 1:
-            return "❌ Some tests failed"
-        elif exit_code == 5:
-            return "⚠️ No tests collected"
-        else:
-            return f"❓ Unknown exit code: {exit_code}"
+        return _STATUS_MESSAGES.get(exit_code) or f"❓ Unknown exit code: {exit_code}"
 
     def suggest_improvements(self, results: Dict) -> List[str]:
         """Generate improvement suggestions based on results."""
-        suggestions = []
-
         if results.get('success'):
-            suggestions.extend([
-                "🎉 Great job! All tests are passing",
-                "💡 Consider adding more edge cases",
-                "🔍 Review code coverage reports",
-                "📈 Monitor test performance trends"
-            ])
+            suggestions = list(_SUCCESS_SUGGESTIONS)
         else:
-            suggestions.extend([
-                "🔧 Review failed tests and fix issues",
-                "📝 Check test data and assertions",
-                "🐛 Look for common patterns in failures",
-                "🚀 Consider test parallelization for faster feedback"
-            ])
+            suggestions = list(_FAILURE_SUGGESTIONS)
 
         # Add report-specific suggestions
         if results.get('report_type') == 'HTML':
@@ -270,20 +499,80 @@ class TestReporter:
 class TestResultsAPI:
     """
     Future: FastAPI backend to serve test results to React dashboard.
+
+    Parsed JSON reports are cached keyed on file mtime, so a dashboard
+    polling these endpoints does not re-parse unchanged report files on
+    every request. The cache is FIFO-capped to bound memory.
     """
 
+    _CACHE_MAX_ENTRIES = 50
+
     def __init__(self, reports_dir: str = "reports"):
         self.reports_dir = reports_dir
-
-    def get_latest_results(self) -> Dict:
+        # path -> (mtime, parsed report)
+        self._cache: Dict[str, tuple] = {}
+        self._history_signature = None
+        self._history_cache: List[Dict] = []
+
+    def _report_files(self) -> List[tuple]:
+        """Return (mtime, path) pairs for report JSON files, newest first."""
+        reports_dir = Path(self.reports_dir)
+        if not reports_dir.is_dir():
+            return []
+
+        entries = [(os.path.getmtime(path), str(path))
+                   for path in reports_dir.glob("test_report_*.json")]
+        entries.sort(reverse=True)
+        return entries
+
+    def _load_report(self, path: str, mtime: float) -> Dict:
+        """Load a JSON report, reusing the cached parse while mtime matches."""
+        cached = self._cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        with open(path, 'rb') as f:
+            data = _loads(f.read())
+
+        # FIFO eviction keeps the cache from growing with report history
+        if len(self._cache) >= self._CACHE_MAX_ENTRIES:
+            self._cache.pop(next(iter(self._cache)))
+        self._cache[path] = (mtime, data)
+        return data
+
+    def get_latest_results(self) -> Optional[Dict]:
         """Get the most recent test results."""
-        # Implementation for serving latest test results
-        pass
+        files = self._report_files()
+        if not files:
+            return None
+
+        mtime, path = files[0]
+        return self._load_report(path, mtime)
 
     def get_test_history(self, limit: int = 10) -> List[Dict]:
         """Get historical test results."""
-        # Implementation for test history
-        pass
+        files = self._report_files()[:limit]
+
+        # Reuse the assembled history while the report files are unchanged
+        signature = tuple(files)
+        if signature == self._history_signature:
+            return self._history_cache
+
+        history = []
+        for mtime, path in files:
+            data = self._load_report(path, mtime)
+            summary = data.get("summary", {})
+            history.append({
+                "timestamp": data.get("created"),
+                "success": summary.get("failed", 0) == 0,
+                "total": summary.get("total", 0),
+                "passed": summary.get("passed", 0),
+                "failed": summary.get("failed", 0)
+            })
+
+        self._history_signature = signature
+        self._history_cache = history
+        return history
 
     def get_test_trends(self) -> Dict:
         """Get test execution trends and statistics."""
@@ -291,142 +580,20 @@ class TestResultsAPI:
         pass
 
 
-# Example FastAPI routes (for future implementation)
-FASTAPI_EXAMPLE = '''
-from fastapi import FastAPI, HTTPException
-from typing import List, Dict
-import json
-import os
-from pathlib import Path
+# The example FastAPI backend and React dashboard live in src/examples as
+# real files instead of multi-kilobyte string constants parsed on every
+# import; load them lazily when a caller actually wants the source
+def get_fastapi_example() -> str:
+    """Return the example FastAPI backend source (src/examples/fastapi_backend.py)."""
+    import importlib.resources
+    return importlib.resources.files("src.examples").joinpath("fastapi_backend.py").read_text(encoding="utf-8")
 
-app = FastAPI(title="AI Test Automation Dashboard")
-
-@app.get("/api/test-results/latest")
-async def get_latest_test_results():
-    """Get the latest test execution results."""
-    reports_dir = Path("reports")
-    json_files = list(reports_dir.glob("test_report_*.json"))
-
-    if not json_files:
-        raise HTTPException(status_code=404, detail="No test reports found")
-
-    latest_file = max(json_files, key=os.path.getctime)
-
-    with open(latest_file) as f:
-        return json.load(f)
-
-@app.get("/api/test-results/history")
-async def get_test_history(limit: int = 10):
-    """Get test execution history."""
-    reports_dir = Path("reports")
-    json_files = sorted(
-        reports_dir.glob("test_report_*.json"), 
-        key=os.path.getctime, 
-        reverse=True
-    )
-
-    results = []
-    for file_path in json_files[:limit]:
-        with open(file_path) as f:
-            data = json.load(f)
-            results.append({
-                "timestamp": data.get("created"),
-                "success": data.get("summary", {}).get("failed", 0) == 0,
-                "total": data.get("summary", {}).get("total", 0),
-                "passed": data.get("summary", {}).get("passed", 0),
-                "failed": data.get("summary", {}).get("failed", 0)
-            })
 
-    return results
-
-@app.get("/api/test-results/trends")
-async def get_test_trends():
-    """Get test execution trends and statistics."""
-    # Implementation for calculating trends
-    return {"message": "Trends endpoint - to be implemented"}
-'''
-
-# React Dashboard Component Example (Future Enhancement)
-REACT_DASHBOARD_EXAMPLE = '''
-// TestDashboard.jsx
-import React, { useState, useEffect } from 'react';
-import axios from 'axios';
-
-const TestDashboard = () => {
-  const [latestResults, setLatestResults] = useState(null);
-  const [testHistory, setTestHistory] = useState([]);
-  const [loading, setLoading] = useState(true);
-
-  useEffect(() => {
-    fetchLatestResults();
-    fetchTestHistory();
-  }, []);
-
-  const fetchLatestResults = async () => {
-    try {
-      const response = await axios.get('/api/test-results/latest');
-      setLatestResults(response.data);
-    } catch (error) {
-      console.error('Error fetching latest results:', error);
-    }
-  };
-
-  const fetchTestHistory = async () => {
-    try {
-      const response = await axios.get('/api/test-results/history');
-      setTestHistory(response.data);
-      setLoading(false);
-    } catch (error) {
-      console.error('Error fetching test history:', error);
-      setLoading(false);
-    }
-  };
-
-  if (loading) {
-    return <div className="loading">Loading test results...</div>;
-  }
-
-  return (
-    <div className="dashboard">
-      <h1>🚀 AI Test Automation Dashboard</h1>
-
-      {/* Latest Results Card */}
-      {latestResults && (
-        <div className="results-card">
-          <h2>Latest Test Results</h2>
-          <div className="summary">
-            <div className={`status ${latestResults.summary?.failed === 0 ? 'success' : 'failure'}`}>
-              {latestResults.summary?.failed === 0 ? '✅ All Passed' : '❌ Some Failed'}
-            </div>
-            <div className="stats">
-              <span>Total: {latestResults.summary?.total}</span>
-              <span>Passed: {latestResults.summary?.passed}</span>
-              <span>Failed: {latestResults.summary?.failed}</span>
-            </div>
-          </div>
-        </div>
-      )}
-
-      {/* Test History Chart */}
-      <div className="history-section">
-        <h2>Test History</h2>
-        <div className="history-list">
-          {testHistory.map((result, index) => (
-            <div key={index} className="history-item">
-              <div className="timestamp">{new Date(result.timestamp).toLocaleString()}</div>
-              <div className={`result ${result.success ? 'success' : 'failure'}`}>
-                {result.success ? '✅' : '❌'} {result.passed}/{result.total}
-              </div>
-            </div>
-          ))}
-        </div>
-      </div>
-    </div>
-  );
-};
-
-export default TestDashboard;
-'''
+def get_react_dashboard_example() -> str:
+    """Return the example React dashboard source (src/examples/react_dashboard.jsx)."""
+    import importlib.resources
+    return importlib.resources.files("src.examples").joinpath("react_dashboard.jsx").read_text(encoding="utf-8")
+
 
 # Usage Example
 if __name__ == "__main__":
@@ -441,44 +608,26 @@ if __name__ == "__main__":
     console_report = reporter.generate_console_report(results)
     print(console_report)
 
-    # Method 2: HTML reporting (requires pytest-html)
-    print("\n2️⃣ Running tests with HTML reporting...")
+    # Method 2: All report formats from a single test run
+    # (requires pytest-html, pytest-json-report, allure-pytest and the
+    # Allure commandline tool)
+    print("\n2️⃣ Running tests once with HTML + JSON + Allure reporting...")
     try:
-        html_results = reporter.run_tests_with_html_report()
-        html_report = reporter.generate_console_report(html_results)
-        print(html_report)
+        all_results = reporter.run_tests_all_formats()
+        all_report = reporter.generate_console_report(all_results)
+        print(all_report)
 
-        if html_results.get('html_report_path'):
-            print(f"📄 Open HTML report: {html_results['html_report_path']}")
-    except Exception as e:
-        print(f"❌ HTML reporting failed: {e}")
-        print("💡 Install with: pip install pytest-html")
+        if all_results.get('html_report_path'):
+            print(f"📄 Open HTML report: {all_results['html_report_path']}")
 
-    # Method 3: JSON reporting (requires pytest-json-report)
-    print("\n3️⃣ Running tests with JSON reporting...")
-    try:
-        json_results = reporter.run_tests_with_json_report()
-        json_report = reporter.generate_console_report(json_results)
-        print(json_report)
-
-        if json_results.get('json_report_path'):
-            print(f"📝 JSON report saved: {json_results['json_report_path']}")
-    except Exception as e:
-        print(f"❌ JSON reporting failed: {e}")
-        print("💡 Install with: pip install pytest-json-report")
-
-    # Method 4: Allure reporting (requires allure-pytest and allure commandline)
-    print("\n4️⃣ Running tests with Allure reporting...")
-    try:
-        allure_results = reporter.run_tests_with_allure_report()
-        allure_report = reporter.generate_console_report(allure_results)
-        print(allure_report)
+        if all_results.get('json_report_path'):
+            print(f"📝 JSON report saved: {all_results['json_report_path']}")
 
-        if allure_results.get('allure_report_dir'):
-            print(f"📈 Open Allure report: {allure_results['allure_report_dir']}/index.html")
+        if all_results.get('allure_report_dir'):
+            print(f"📈 Open Allure report: {all_results['allure_report_dir']}/index.html")
     except Exception as e:
-        print(f"❌ Allure reporting failed: {e}")
-        print("💡 Install with: pip install allure-pytest")
+        print(f"❌ Combined reporting failed: {e}")
+        print("💡 Install with: pip install pytest-html pytest-json-report allure-pytest")
         print("💡 Install Allure CLI: https://docs.qameta.io/allure/#_installing_a_commandline")
 
     print("\n🔮 Future Enhancements:")
@@ -1,6 +1,31 @@
+import concurrent.futures
+import functools
 import json
+import os
 import re
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+# Below this many requirements the process-pool startup cost outweighs
+# the parallel speedup, so parsing stays serial
+_PARALLEL_THRESHOLD = 32
+
+# Optional: orjson is a few times faster than stdlib json on encode and
+# decode. Installation: pip install orjson
+try:
+    import orjson
+
+    def _dumps(obj, indent: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+
+    def _loads(data):
+        return orjson.loads(data)
+except ImportError:
+    def _dumps(obj, indent: bool = False) -> bytes:
+        return json.dumps(obj, indent=4 if indent else None,
+                          ensure_ascii=False).encode('utf-8')
+
+    def _loads(data):
+        return json.loads(data)
 
 
 class RequirementsParser:
@@ -9,6 +34,9 @@ class RequirementsParser:
     into structured JSON format for test case generation.
     """
 
+    # Cap on distinct template signatures kept (see _parse_with_template)
+    _TEMPLATE_CACHE_MAX = 256
+
     def __init__(self):
         # Keywords for identifying different requirement components
         self.action_keywords = ['login', 'register', 'validate', 'authenticate', 'create', 'delete', 'update', 'view',
@@ -16,6 +44,30 @@ class RequirementsParser:
         self.condition_keywords = ['with', 'using', 'when', 'if', 'valid', 'invalid', 'correct', 'incorrect']
         self.expectation_keywords = ['should', 'must', 'will', 'expected', 'successful', 'failure']
 
+        # Precompiled patterns for the extraction passes, so the hot path
+        # dispatches straight to compiled Pattern objects instead of going
+        # through the re module's per-call pattern-cache lookup
+        self._re_should_word = re.compile(r'should\s+(\w+)')
+        self._re_with = re.compile(r'with\s+([^.]+?)(?:\s+and|\s*\.|\s*$)')
+        self._re_using = re.compile(r'using\s+([^.]+?)(?:\s+and|\s*\.|\s*$)')
+        self._re_valid = re.compile(r'(valid\s+\w+)')
+        self._re_invalid = re.compile(r'(invalid\s+\w+)')
+        self._re_should_tail = re.compile(r'should\s+(.+?)(?:\s*\.|\s*$)')
+
+        # Template specialization: requirements tend to follow a handful of
+        # phrasings ("The system should ...", "Users must be able to ..."),
+        # so extractors specialized per leading-words signature can skip the
+        # scans that never fire for that template (see _build_specialized)
+        self._template_cache = {}
+
+    def __getstate__(self):
+        # The specialized extractors are closures and cannot be pickled, so
+        # the cache is dropped from the pickled state; pool workers in
+        # parse_multiple_requirements rebuild their own specializations
+        state = self.__dict__.copy()
+        state['_template_cache'] = {}
+        return state
+
     def parse_requirement(self, requirement_text: str) -> Dict:
         """
         Parse a plain text requirement into structured JSON format.
@@ -29,92 +81,181 @@ class RequirementsParser:
         # Clean and normalize the input text
         text = requirement_text.lower().strip()
 
-        # Extract feature/action
-        feature = self._extract_feature(text)
-
-        # Extract conditions
-        conditions = self._extract_conditions(text)
-
-        # Extract expected outcome
-        expected = self._extract_expected_outcome(text)
+        # Parsing is pure given the normalized text, so identical
+        # requirements (common across batches and re-runs) hit the cache
+        feature, conditions, expected = self._parse_cached(text)
 
-        # Create structured output
+        # Create structured output (original_text stays outside the cache
+        # so the cache key is the normalized text)
         parsed_requirement = {
             "feature": feature,
-            "conditions": conditions,
+            "conditions": list(conditions),
             "expected": expected,
             "original_text": requirement_text
         }
 
         return parsed_requirement
 
-    def _extract_feature(self, text: str) -> str:
-        """Extract the main feature/action from the requirement text."""
-        # Look for common action keywords
-        for keyword in self.action_keywords:
-            if keyword in text:
-                return keyword
-
-        # If no keyword found, try to extract from "should" patterns
-        should_match = re.search(r'should\s+(\w+)', text)
-        if should_match:
-            return should_match.group(1)
-
-        # Default fallback
-        return "unknown_feature"
-
-    def _extract_conditions(self, text: str) -> List[str]:
-        """Extract conditions from the requirement text."""
-        conditions = []
-
-        # Look for "with" patterns
-        with_match = re.findall(r'with\s+([^.]+?)(?:\s+and|\s*\.|\s*$)', text)
-        for match in with_match:
-            conditions.append(match.strip())
-
-        # Look for "using" patterns
-        using_match = re.findall(r'using\s+([^.]+?)(?:\s+and|\s*\.|\s*$)', text)
-        for match in using_match:
-            conditions.append(match.strip())
+    @functools.lru_cache(maxsize=1024)
+    def _parse_cached(self, text: str) -> Tuple[str, Tuple[str, ...], str]:
+        """
+        Run the regex extraction passes over normalized text.
 
-        # Look for "valid/invalid" patterns
-        valid_match = re.findall(r'(valid\s+\w+)', text)
-        conditions.extend(valid_match)
+        Memoized with lru_cache, so the result must be hashable: conditions
+        are returned as a tuple and converted back to a list by the caller.
+        """
+        feature, conditions, expected = self._parse_with_template(text)
+        return feature, tuple(conditions), expected
 
-        invalid_match = re.findall(r'(invalid\s+\w+)', text)
-        conditions.extend(invalid_match)
+    def _parse_with_template(self, text: str) -> Tuple[str, List[str], str]:
+        """
+        Parse via a template-specialized extractor when one exists.
 
-        return conditions if conditions else ["no specific conditions"]
+        The cache is keyed on the first three words of the text. A cache hit
+        runs a specialized extractor that skips the scans the profiled
+        template never triggered; if the new text breaks the specialization's
+        guards it returns None and parsing falls back to _extract_all. Each
+        new signature is profiled once and its specialization stored.
+        """
+        signature = ' '.join(text.split()[:3])
+        specialized = self._template_cache.get(signature)
+        if specialized is not None:
+            result = specialized(text)
+            if result is not None:
+                return result
+
+        result = self._extract_all(text)
+        if specialized is None and len(self._template_cache) < self._TEMPLATE_CACHE_MAX:
+            self._template_cache[signature] = self._build_specialized(text, result[0])
+        return result
+
+    def _build_specialized(self, profile_text: str, feature: str):
+        """
+        Build a specialized extractor from one profiled requirement.
+
+        The specialization records which condition markers (with/using/
+        valid/invalid) the profiled text contained and which action keyword
+        won, then only runs those scans. Guards keep it exact: if a later
+        text with the same signature introduces an unprofiled marker, or
+        drops/outranks the profiled keyword, the extractor returns None and
+        the caller falls back to the generic path.
+        """
+        marker_scans = {'with': self._re_with, 'using': self._re_using,
+                        'valid': self._re_valid, 'invalid': self._re_invalid}
+        seen_markers = [m for m in marker_scans if m in profile_text]
+        unseen_markers = [m for m in marker_scans if m not in profile_text]
+
+        try:
+            feature_rank = self.action_keywords.index(feature)
+        except ValueError:
+            # Feature came from the "should" regex, not a keyword; there is
+            # no scan worth skipping, so don't specialize this template
+            return lambda text: None
+        earlier_keywords = self.action_keywords[:feature_rank]
+
+        def specialized(text: str):
+            # Guards: profiled keyword still wins, no unprofiled markers
+            if feature not in text:
+                return None
+            for keyword in earlier_keywords:
+                if keyword in text:
+                    return None
+            for marker in unseen_markers:
+                if marker in text:
+                    return None
+
+            conditions = []
+            for marker in seen_markers:
+                if marker in ('with', 'using'):
+                    conditions += [match.strip() for match in marker_scans[marker].findall(text)]
+                else:
+                    conditions += marker_scans[marker].findall(text)
+            if not conditions:
+                conditions = ["no specific conditions"]
+
+            if 'successful' in text:
+                expected = f"successful {feature}"
+            elif 'failure' in text or 'error' in text:
+                expected = "failure or error message"
+            else:
+                should_match = self._re_should_tail.search(text)
+                if should_match:
+                    expected = should_match.group(1).strip()
+                else:
+                    expected = "system responds appropriately"
+
+            return feature, conditions, expected
+
+        return specialized
+
+    def _extract_all(self, text: str) -> Tuple[str, List[str], str]:
+        """
+        Extract feature, conditions, and expected outcome in one fused pass.
 
-    def _extract_expected_outcome(self, text: str) -> str:
-        """Extract the expected outcome from the requirement text."""
-        # Look for explicit expectations
+        The three extraction stages previously each re-scanned the text
+        independently; doing them together shares the action-keyword scan,
+        so the feature is computed once and reused when building the
+        expected outcome instead of being re-derived from scratch.
+        """
+        # Feature: first action keyword present, else the word after "should"
+        feature = None
+        for keyword in self.action_keywords:
+            if keyword in text:
+                feature = keyword
+                break
+        if feature is None:
+            should_match = self._re_should_word.search(text)
+            feature = should_match.group(1) if should_match else "unknown_feature"
+
+        # Conditions: "with"/"using" clauses plus valid/invalid mentions
+        conditions = [match.strip() for match in self._re_with.findall(text)]
+        conditions += [match.strip() for match in self._re_using.findall(text)]
+        conditions += self._re_valid.findall(text)
+        conditions += self._re_invalid.findall(text)
+        if not conditions:
+            conditions = ["no specific conditions"]
+
+        # Expected outcome: one membership chain, reusing the feature above
         if 'successful' in text:
-            feature = self._extract_feature(text)
-            return f"successful {feature}"
-
-        if 'failure' in text or 'error' in text:
-            return "failure or error message"
-
-        # Look for "should" outcomes
-        should_match = re.search(r'should\s+(.+?)(?:\s*\.|\s*$)', text)
-        if should_match:
-            return should_match.group(1).strip()
-
-        # Default expectation
-        return "system responds appropriately"
-
-    def parse_multiple_requirements(self, requirements_list: List[str]) -> List[Dict]:
+            expected = f"successful {feature}"
+        elif 'failure' in text or 'error' in text:
+            expected = "failure or error message"
+        else:
+            should_match = self._re_should_tail.search(text)
+            if should_match:
+                expected = should_match.group(1).strip()
+            else:
+                expected = "system responds appropriately"
+
+        return feature, conditions, expected
+
+    def parse_multiple_requirements(self, requirements_list: List[str],
+                                    workers: int = None) -> List[Dict]:
         """
         Parse multiple requirements at once.
 
+        Each requirement is an independent CPU-bound regex job, so large
+        batches fan out across a process pool. Small batches stay serial
+        because the pool startup cost would dominate.
+
         Args:
             requirements_list (List[str]): List of requirement texts
+            workers (int): Process count for large batches; defaults to
+                cpu_count() - 2 to leave the machine some headroom
 
         Returns:
             List[Dict]: List of parsed requirements
         """
-        return [self.parse_requirement(req) for req in requirements_list]
+        if len(requirements_list) < _PARALLEL_THRESHOLD:
+            return [self.parse_requirement(req) for req in requirements_list]
+
+        if workers is None:
+            workers = max(1, (os.cpu_count() or 1) - 2)
+
+        chunksize = max(1, len(requirements_list) // (workers * 4))
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.parse_requirement, requirements_list,
+                                     chunksize=chunksize))
 
     def save_parsed_requirements(self, parsed_requirements: List[Dict], filename: str) -> None:
         """
@@ -124,8 +265,9 @@ class RequirementsParser:
             parsed_requirements (List[Dict]): Parsed requirements
             filename (str): Output filename
         """
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(parsed_requirements, f, indent=4, ensure_ascii=False)
+        # Binary mode: _dumps returns bytes, so no extra decode/encode pass
+        with open(filename, 'wb') as f:
+            f.write(_dumps(parsed_requirements, indent=True))
 
     def load_requirements_from_file(self, filename: str) -> List[str]:
         """
@@ -1,3 +1,6 @@
+import re
+
+
 def add(a, b):
     """Simple addition function."""
     return a + b
@@ -15,9 +18,17 @@ def multiply(a, b):
 
 def divide(a, b):
     """Division function with zero check."""
-    if b == 0:
+    # Common path pays no comparison; the rare zero divisor surfaces as
+    # the same ValueError as before
+    try:
+        return a / b
+    except ZeroDivisionError:
         raise ValueError("Cannot divide by zero")
-    return a / b
+
+
+# User ids precomputed at import time; the valid-user set is fixed, so
+# login does a lookup instead of re-hashing the username on every call
+_USER_IDS = {u: hash(u) for u in ('user', 'admin', 'testuser')}
 
 
 def login(username, password):
@@ -31,7 +42,7 @@ def login(username, password):
     if username in valid_users and valid_users[username] == password:
         return {
             'status': 'success',
-            'user_id': hash(username),
+            'user_id': _USER_IDS[username],
             'username': username
         }
     return {
@@ -40,23 +51,15 @@ def login(username, password):
     }
 
 
-def validate_email(email: str) -> bool:
-    """Better email validation function."""
-    if "@" not in email or "." not in email:
-        return False
-
-    parts = email.split("@")
-    if len(parts) != 2:  # more than one '@'
-        return False
-
-    local, domain = parts
-    if not local or not domain:  # empty before/after '@'
-        return False
+# One non-empty local part, one '@', and a domain containing a dot —
+# a single compiled-regex pass over the same rules validate_email used
+# to apply with several scans and splits
+_EMAIL_RE = re.compile(r'[^@]+@[^@]+\.[^@]+')
 
-    if "." not in domain:  # domain must contain dot
-        return False
 
-    return True
+def validate_email(email: str) -> bool:
+    """Better email validation function."""
+    return _EMAIL_RE.fullmatch(email) is not None
 
 
 def calculate_discount(price, discount_percent):
@@ -64,8 +67,9 @@ def calculate_discount(price, discount_percent):
     if discount_percent < 0 or discount_percent > 100:
         raise ValueError("Discount percent must be between 0 and 100")
 
-    discount_amount = price * (discount_percent / 100)
-    return price - discount_amount
+    # Fused form of price - price * (percent / 100); integer inputs stay
+    # in integer arithmetic until the final divide
+    return price * (100 - discount_percent) / 100
 
 
 class Calculator:
@@ -76,11 +80,13 @@ class Calculator:
 
     def add(self, a, b):
         result = a + b
-        self.history.append(f"{a} + {b} = {result}")
+        # Store raw operands; formatting is deferred to get_history so the
+        # hot add path skips the f-string work
+        self.history.append((a, b, result))
         return result
 
     def get_history(self):
-        return self.history
+        return [f"{a} + {b} = {result}" for a, b, result in self.history]
 
     def clear_history(self):
         self.history = []
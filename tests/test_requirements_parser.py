@@ -0,0 +1,22 @@
+from src.requirements_parser import RequirementsParser
+
+
+class TestParallelParsing:
+    """Test cases for the parallel requirement parsing path."""
+
+    def test_large_batch_after_cache_warmup(self):
+        """A warmed parser must survive pickling into the process pool."""
+        parser = RequirementsParser()
+
+        # Warm the template cache so the instance carries specialized
+        # extractor closures before the parallel path pickles it
+        warmup = parser.parse_requirement(
+            "The system should allow login with username and password.")
+        assert warmup["feature"] == "login"
+
+        batch = [f"The system should allow login with token {i}."
+                 for i in range(40)]
+        results = parser.parse_multiple_requirements(batch)
+
+        assert len(results) == len(batch)
+        assert all(result["feature"] == "login" for result in results)